@@ -0,0 +1,24 @@
+# numba kernels for main.py. They live in an imported module (not the Streamlit
+# script, which re-executes on every rerun) so each dispatcher compiles/loads once per process.
+import numpy as np
+
+try:  # optional: JIT kernel for Success/Explosive over large tables
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def success_explosive(down, dist, gained, runlike):
+        n = down.shape[0]
+        success = np.empty(n, dtype=np.bool_)
+        explosive = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            d = down[i]
+            # three-way select on one threshold keeps the loop body branch-free
+            t = 4.0 if d == 1 else (0.5 * dist[i] if d == 2 else dist[i])
+            success[i] = gained[i] >= t
+            explosive[i] = gained[i] >= (10.0 if runlike[i] else 15.0)
+        return success, explosive
+else:
+    success_explosive = None
@@ -1,22 +1,169 @@
 # app.py
+import csv
+import io
 import os
+import re
+import tempfile
 from datetime import datetime
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import streamlit as st
-import matplotlib.pyplot as plt
+
+from kernels import success_explosive as _success_explosive_kernel
 
 # =========================
 # CONFIG
 # =========================
 APP_TITLE = "🏈 Football Game Tracker"
 DATA_FILE = "plays.csv"                      # used if USE_GOOGLE_SHEETS = False
+SNAPSHOT_VERSION = 2                         # bump whenever _clean changes what it produces
 GOOGLE_SHEET_NAME = "Football Plays"         # used if USE_GOOGLE_SHEETS = True
 USE_GOOGLE_SHEETS = False                    # <-- set True to use Google Sheets backend
+SHEETS_BATCH_ROWS = 5                        # queued plays are pushed to Sheets once this many pile up
+DERIVED_COLUMNS = ["_runlike", "_explosive"]  # computed at load; never shown or exported
+NUMBA_MIN_ROWS = 20000                       # use the numba kernel above this many plays
 
 # =========================
 # DATA ACCESS LAYER
 # =========================
+def _clean(df: pd.DataFrame) -> pd.DataFrame:
+    # coerce types
+    if not df.empty:
+        for col in ["Quarter","Down","Distance","YardLine","ResultYards"]:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+        # low-cardinality text: filters and counts work on int codes
+        for col in ["Game","Opponent","TeamSide","Hash","PlayType"]:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+        # run/RPO flag computed once per data version; pages slice it instead of re-matching
+        if "PlayType" in df.columns:
+            df["_runlike"] = runlike_mask(df["PlayType"])
+        if "Success" in df.columns:
+            raw = df["Success"]
+            missing = raw.isna() | (raw.astype(str).str.strip() == "")
+            df["Success"] = raw.astype(str).str.lower().isin(["true","1","yes","y","t"])
+        # one fused pass yields the explosive flag for every play and Success for blank cells
+        if {"Down","Distance","ResultYards","_runlike"} <= set(df.columns):
+            calc, explosive = success_and_explosive(df["Down"], df["Distance"], df["ResultYards"],
+                                                    df["_runlike"])
+            df["_explosive"] = explosive
+            if "Success" in df.columns and missing.any():
+                df["Success"] = np.where(missing, calc, df["Success"])
+    return df
+
+
+def _distinct(col: pd.Series) -> list:
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return sorted({str(c) for c in col.cat.categories})
+    return sorted(col.dropna().astype(str).unique().tolist())
+
+
+# selectbox choices, built once per data version instead of on every rerun
+def _filter_options(df: pd.DataFrame) -> dict:
+    if df.empty:
+        return {"games": [], "opponents": [], "formations_by_side": {}}
+    return {
+        "games": _distinct(df["Game"]),
+        "opponents": _distinct(df["Opponent"]),
+        "formations_by_side": {
+            side: sorted(grp["Formation"].dropna().astype(str).unique().tolist())
+            for side, grp in df.groupby("TeamSide", observed=True)
+        },
+    }
+
+
+# typed copy of a plays CSV; the version in the name retires snapshots from older _clean logic
+def _snapshot_path(path: str) -> str:
+    return f"{os.path.splitext(path)[0]}.v{SNAPSHOT_VERSION}.parquet"
+
+
+# a snapshot is only usable if it still carries every CSV column plus the derived ones
+def _snapshot_ok(df: pd.DataFrame, path: str) -> bool:
+    with open(path, newline="") as f:
+        header = next(csv.reader(f), [])
+    expected = set(header)
+    if not df.empty and "PlayType" in expected:
+        expected.add("_runlike")
+        if {"Down","Distance","ResultYards"} <= expected:
+            expected.add("_explosive")
+    return expected <= set(df.columns)
+
+
+# identifies the exact CSV contents a snapshot was built from
+def _csv_stamp(path: str) -> tuple[int, int]:
+    info = os.stat(path)
+    return info.st_mtime_ns, info.st_size
+
+
+_SNAPSHOT_SOURCE_KEY = b"football:source"
+
+
+def _read_snapshot(snapshot: str, source: bytes):
+    try:
+        table = pq.read_table(snapshot)
+    except (OSError, pa.ArrowException):
+        return None  # missing or half-written: fall back to the CSV
+    if (table.schema.metadata or {}).get(_SNAPSHOT_SOURCE_KEY) != source:
+        return None
+    return table.to_pandas()
+
+
+def _write_snapshot(df: pd.DataFrame, snapshot: str, source: bytes):
+    # write beside the target, then swap it in so readers never see a partial file
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(snapshot) + ".",
+                               suffix=".tmp.parquet", dir=os.path.dirname(snapshot) or ".")
+    os.close(fd)
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        meta = dict(table.schema.metadata or {})
+        meta[_SNAPSHOT_SOURCE_KEY] = source
+        pq.write_table(table.replace_schema_metadata(meta), tmp, compression="zstd")
+        os.replace(tmp, snapshot)
+    except (OSError, ValueError, TypeError, pa.ArrowException):
+        # snapshot is only a speed-up; the CSV stays the source of truth
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+@st.cache_data(show_spinner=False)
+def _load_csv(path: str, stamp: tuple[int, int]) -> tuple[pd.DataFrame, dict]:
+    # stamp (mtime_ns, size) is taken before reading, so it never claims newer data than was parsed;
+    # a snapshot is only trusted when it was built from exactly this CSV version
+    source = f"{stamp[0]}:{stamp[1]}".encode()
+    snapshot = _snapshot_path(path)
+    df = _read_snapshot(snapshot, source)
+    if df is not None and _snapshot_ok(df, path):
+        return df, _filter_options(df)
+    df = _clean(pd.read_csv(path))
+    _write_snapshot(df, snapshot, source)
+    return df, _filter_options(df)
+
+
+# gspread/oauth2client are only imported (and authorized) once per server process,
+# and never when the CSV backend is in use
+@st.cache_resource(show_spinner=False)
+def _gsheet_client():
+    import gspread
+    from oauth2client.service_account import ServiceAccountCredentials
+    scope = ["https://spreadsheets.google.com/feeds",
+             "https://www.googleapis.com/auth/drive"]
+    creds = ServiceAccountCredentials.from_json_keyfile_name("credentials.json", scope)
+    client = gspread.authorize(creds)
+    return client.open(GOOGLE_SHEET_NAME).sheet1
+
+
+# header check costs a roundtrip, so it runs once per process (overwrite rewrites the header itself)
+@st.cache_resource(show_spinner=False)
+def _ensure_sheet_header(columns: tuple) -> bool:
+    sh = _gsheet_client()
+    if sh.row_count == 0 or sh.row_values(1) == []:
+        sh.append_row(list(columns))
+    return True
+
+
 class Storage:
     def __init__(self):
         self.columns = [
@@ -29,77 +176,98 @@ class Storage:
         else:
             self._init_csv()
 
+    # ---- Google Sheets backend
+    def _init_gsheets(self):
+        self._sheet = _gsheet_client()
+
     # ---- CSV backend
     def _init_csv(self):
         if not os.path.exists(DATA_FILE):
             pd.DataFrame(columns=self.columns).to_csv(DATA_FILE, index=False)
 
-    def load(self) -> pd.DataFrame:
+    # returns the plays plus the filter choices derived from them
+    def load(self) -> tuple[pd.DataFrame, dict]:
         if USE_GOOGLE_SHEETS:
-            import gspread
-            from oauth2client.service_account import ServiceAccountCredentials
-            scope = ["https://spreadsheets.google.com/feeds",
-                     "https://www.googleapis.com/auth/drive"]
-            creds = ServiceAccountCredentials.from_json_keyfile_name("credentials.json", scope)
-            client = gspread.authorize(creds)
-            sh = client.open(GOOGLE_SHEET_NAME).sheet1
-            data = sh.get_all_records()
+            # plays still queued for the sheet are shown as if already synced
+            data = self._sheet.get_all_records() + st.session_state.get("pending_rows", [])
             df = pd.DataFrame(data)
             if df.empty:
-                return pd.DataFrame(columns=self.columns)
+                df = pd.DataFrame(columns=self.columns)
+                return df, _filter_options(df)
             # ensure column order/superset
             for c in self.columns:
                 if c not in df.columns:
                     df[c] = np.nan
-            return df[self.columns]
+            df = _clean(df[self.columns])
+            return df, _filter_options(df)
         else:
             try:
-                df = pd.read_csv(DATA_FILE)
+                stamp = _csv_stamp(DATA_FILE)
             except FileNotFoundError:
                 df = pd.DataFrame(columns=self.columns)
-            # coerce types
-            return df
+                return df, _filter_options(df)
+            return _load_csv(DATA_FILE, stamp)
 
     def append_row(self, row: dict):
         if USE_GOOGLE_SHEETS:
-            import gspread
-            from oauth2client.service_account import ServiceAccountCredentials
-            scope = ["https://spreadsheets.google.com/feeds",
-                     "https://www.googleapis.com/auth/drive"]
-            creds = ServiceAccountCredentials.from_json_keyfile_name("credentials.json", scope)
-            client = gspread.authorize(creds)
-            sh = client.open(GOOGLE_SHEET_NAME).sheet1
-            # Ensure header exists
-            if sh.row_count == 0 or sh.row_values(1) == []:
-                sh.append_row(self.columns)
-            values = [row.get(c, "") for c in self.columns]
-            sh.append_row(values)
+            # queue; the batch goes out in one API call when it fills up or on Sync
+            pending = st.session_state.setdefault("pending_rows", [])
+            pending.append(row)
+            if len(pending) >= SHEETS_BATCH_ROWS:
+                self.flush()
         else:
-            df = self.load()
-            new_df = pd.DataFrame([row])
-            df = pd.concat([df, new_df], ignore_index=True)
-            df.to_csv(DATA_FILE, index=False)
-
-    def overwrite(self, df: pd.DataFrame):
+            self._init_csv()
+            # follow the file's own header so older files with extra columns stay aligned
+            with open(DATA_FILE, newline="") as f:
+                header = next(csv.reader(f), None) or self.columns
+            with open(DATA_FILE, "a", newline="") as f:
+                csv.writer(f).writerow([row.get(c, "") for c in header])
+            _load_csv.clear()
+
+    # one API roundtrip for a whole batch of plays (Google Sheets only)
+    def append_rows(self, rows: list[dict]):
+        if not rows:
+            return
+        sh = self._sheet
+        _ensure_sheet_header(tuple(self.columns))
+        values = [[row.get(c, "") for c in self.columns] for row in rows]
+        sh.append_rows(values, value_input_option="RAW")
+
+    # push plays queued by append_row; returns how many were written
+    def flush(self) -> int:
+        rows = st.session_state.get("pending_rows", [])
+        if USE_GOOGLE_SHEETS and rows:
+            self.append_rows(rows)
+            st.session_state["pending_rows"] = []
+        return len(rows)
+
+    # returns how many queued (unsynced) Sheets plays were discarded
+    def overwrite(self, df: pd.DataFrame) -> int:
+        dropped = 0
         df = df.copy()
         for c in self.columns:
             if c not in df.columns:
                 df[c] = np.nan
         df = df[self.columns]
+        # keep Success consistent with the rule for every row we can score
+        scored = df["Down"].notna() & df["Distance"].notna() & df["ResultYards"].notna()
+        if scored.any():
+            calc = compute_success_vec(pd.to_numeric(df["Down"], errors="coerce"),
+                                       pd.to_numeric(df["Distance"], errors="coerce"),
+                                       pd.to_numeric(df["ResultYards"], errors="coerce"))
+            df["Success"] = np.where(scored, calc, df["Success"])
         if USE_GOOGLE_SHEETS:
-            import gspread
-            from oauth2client.service_account import ServiceAccountCredentials
-            scope = ["https://spreadsheets.google.com/feeds",
-                     "https://www.googleapis.com/auth/drive"]
-            creds = ServiceAccountCredentials.from_json_keyfile_name("credentials.json", scope)
-            client = gspread.authorize(creds)
-            sh = client.open(GOOGLE_SHEET_NAME).sheet1
+            dropped = len(st.session_state.get("pending_rows", []))
+            st.session_state["pending_rows"] = []
+            sh = self._sheet
             sh.clear()
             sh.append_row(self.columns)
             if not df.empty:
                 sh.append_rows(df.values.tolist())
         else:
             df.to_csv(DATA_FILE, index=False)
+            _load_csv.clear()
+        return dropped
 
 storage = Storage()
 
@@ -114,10 +282,83 @@ def compute_success(down: int, distance: float, gained: float) -> bool:
     return gained >= distance  # 3rd / 4th
 
 
-def explosive_mask(df):
-    pt = df["PlayType"].astype(str).str.lower()
-    is_runlike = pt.str.contains("run|rpo")
-    return (is_runlike & (df["ResultYards"] >= 10)) | ((~is_runlike) & (df["ResultYards"] >= 15))
+# yards needed for a successful play: a select on down rather than branches
+def success_threshold(down, distance):
+    return np.where(down == 1, 4.0, np.where(down == 2, distance * 0.5, distance))
+
+
+# same rule as compute_success, over whole columns at once
+def compute_success_vec(down, distance, gained):
+    down = np.asarray(down, dtype=float)
+    distance = np.asarray(distance, dtype=float)
+    gained = np.asarray(gained, dtype=float)
+    return gained >= success_threshold(down, distance)
+
+
+# Success and Explosive flags in one pass; numba when available and worth the dispatch
+def success_and_explosive(down, distance, gained, is_runlike):
+    down = np.asarray(down, dtype=np.float64)
+    distance = np.asarray(distance, dtype=np.float64)
+    gained = np.asarray(gained, dtype=np.float64)
+    runlike = np.asarray(is_runlike, dtype=np.bool_)
+    if _success_explosive_kernel is not None and down.shape[0] > NUMBA_MIN_ROWS:
+        return _success_explosive_kernel(down, distance, gained, runlike)
+    explosive = gained >= np.where(runlike, 10.0, 15.0)
+    return compute_success_vec(down, distance, gained), explosive
+
+
+def value_mask(col: pd.Series, value: str) -> np.ndarray:
+    # compare as text like the selectboxes do; for categoricals that is an int compare on codes
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        hits = np.flatnonzero(col.cat.categories.astype(str) == value)
+        return np.isin(col.cat.codes.to_numpy(), hits)
+    return (col.astype(str) == value).to_numpy()
+
+
+# AND the selected filters into one mask, then gather once
+def filter_plays(df: pd.DataFrame, selections: dict) -> pd.DataFrame:
+    picks = {c: v for c, v in selections.items() if v != "(all)"}
+    if not picks:
+        return df
+    mask = np.ones(len(df), dtype=bool)
+    for c, v in picks.items():
+        mask &= value_mask(df[c], v)
+    return df.iloc[np.flatnonzero(mask)]
+
+
+_RUNLIKE_RE = re.compile(r"run|rpo")
+
+
+def runlike_mask(play_type: pd.Series) -> pd.Series:
+    if isinstance(play_type.dtype, pd.CategoricalDtype):
+        # match once per category, then broadcast through the codes
+        cats = np.asarray(play_type.cat.categories.astype(str).str.lower().str.contains(_RUNLIKE_RE), dtype=bool)
+        codes = play_type.cat.codes.to_numpy()
+        mask = np.zeros(len(codes), dtype=bool)
+        mask[codes >= 0] = cats[codes[codes >= 0]]
+        return pd.Series(mask, index=play_type.index)
+    return play_type.astype(str).str.lower().str.contains(_RUNLIKE_RE, na=False)
+
+
+def explosive_mask(df, is_runlike=None):
+    if is_runlike is None:
+        if "_explosive" in df.columns:
+            return df["_explosive"]  # precomputed at load
+        is_runlike = df["_runlike"] if "_runlike" in df.columns else runlike_mask(df["PlayType"])
+    yards = np.asarray(df["ResultYards"], dtype=float)
+    return pd.Series(yards >= np.where(is_runlike, 10.0, 15.0), index=df.index)
+
+
+# per-down table shared by Analytics and Formation Explorer
+def _by_down(sub: pd.DataFrame) -> pd.DataFrame:
+    by_down = sub.groupby("Down").agg(
+        Plays=("Down","count"),
+        SuccessRate=("Success","mean"),
+        AvgYds=("ResultYards","mean")
+    ).reset_index()
+    if not by_down.empty:
+        by_down["SuccessRate"] = (by_down["SuccessRate"]*100).round(1)
+    return by_down
 
 # =========================
 # UI: SIDEBAR NAV
@@ -131,14 +372,7 @@ page = st.sidebar.radio(
     index=0
 )
 
-df = storage.load()
-# Basic cleaning
-if not df.empty:
-    for col in ["Quarter","Down","Distance","YardLine","ResultYards"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-    if "Success" in df.columns:
-        df["Success"] = df["Success"].astype(str).str.lower().isin(["true","1","yes","y","t"])
+df, options = storage.load()
 
 # =========================
 # PAGE: DATA ENTRY
@@ -183,7 +417,19 @@ if page == "Data Entry":
                 "Notes": notes.strip()
             }
             storage.append_row(row)
-            st.success("✅ Play added.")
+            if USE_GOOGLE_SHEETS and st.session_state.get("pending_rows"):
+                st.success("✅ Play queued for Google Sheets.")
+            else:
+                st.success("✅ Play added.")
+
+    pending = len(st.session_state.get("pending_rows", []))
+    if USE_GOOGLE_SHEETS and pending:
+        if st.button("Sync to Google Sheets"):
+            st.success(f"Synced {storage.flush()} play(s).")
+        else:
+            st.warning(f"{pending} play(s) not yet synced to Google Sheets. They are sent once "
+                       f"{SHEETS_BATCH_ROWS} are queued or when you click Sync, and are lost if "
+                       "this session ends first.")
 
 # =========================
 # PAGE: PLAY LOG
@@ -195,22 +441,16 @@ elif page == "Play Log":
     else:
         # Filters
         fc1, fc2, fc3 = st.columns(3)
-        games = ["(all)"] + sorted([x for x in df["Game"].dropna().astype(str).unique()])
-        opps  = ["(all)"] + sorted([x for x in df["Opponent"].dropna().astype(str).unique()])
+        games = ["(all)"] + options["games"]
+        opps  = ["(all)"] + options["opponents"]
         sides = ["(all)","Offense","Defense"]
         gsel = fc1.selectbox("Game", games)
         osel = fc2.selectbox("Opponent", opps)
         ssel = fc3.selectbox("Side", sides)
 
-        sub = df.copy()
-        if gsel != "(all)":
-            sub = sub[sub["Game"].astype(str)==gsel]
-        if osel != "(all)":
-            sub = sub[sub["Opponent"].astype(str)==osel]
-        if ssel != "(all)":
-            sub = sub[sub["TeamSide"]==ssel]
+        sub = filter_plays(df, {"Game": gsel, "Opponent": osel, "TeamSide": ssel})
 
-        st.dataframe(sub, use_container_width=True)
+        st.dataframe(sub.drop(columns=DERIVED_COLUMNS, errors="ignore"), use_container_width=True)
 
 # =========================
 # PAGE: ANALYTICS
@@ -222,19 +462,15 @@ elif page == "Analytics":
     else:
         # filter by game/opponent
         c1,c2 = st.columns(2)
-        game = c1.selectbox("Game", ["(all)"] + sorted(df["Game"].dropna().astype(str).unique().tolist()))
-        opp  = c2.selectbox("Opponent", ["(all)"] + sorted(df["Opponent"].dropna().astype(str).unique().tolist()))
-        sub = df.copy()
-        if game != "(all)":
-            sub = sub[sub["Game"].astype(str)==game]
-        if opp != "(all)":
-            sub = sub[sub["Opponent"].astype(str)==opp]
+        game = c1.selectbox("Game", ["(all)"] + options["games"])
+        opp  = c2.selectbox("Opponent", ["(all)"] + options["opponents"])
+        sub = filter_plays(df, {"Game": game, "Opponent": opp})
 
         # totals
         st.metric("Total Plays", len(sub))
         m1, m2, m3, m4 = st.columns(4)
         if len(sub):
-            runlike = sub["PlayType"].astype(str).str.lower().str.contains("run|rpo")
+            runlike = sub["_runlike"]
             passlike = ~runlike
             m1.metric("Run %", f"{(runlike.mean()*100):.1f}%")
             m2.metric("Pass %", f"{(passlike.mean()*100):.1f}%")
@@ -243,25 +479,17 @@ elif page == "Analytics":
 
         # bar: play type counts
         st.write("**Play Types**")
-        counts = sub["PlayType"].fillna("Unknown").value_counts()
+        counts = sub["PlayType"].astype(object).fillna("Unknown").value_counts()
         st.bar_chart(counts)
 
         # by down
         st.write("**By Down**")
-        by_down = sub.groupby("Down").agg(
-            Plays=("Down","count"),
-            SuccessRate=("Success","mean"),
-            AvgYds=("ResultYards","mean")
-        ).reset_index()
-        if not by_down.empty:
-            by_down["SuccessRate"] = (by_down["SuccessRate"]*100).round(1)
-        st.dataframe(by_down)
+        st.dataframe(_by_down(sub))
 
         # explosive rate
         if "ResultYards" in sub.columns:
             st.write("**Explosive Rate**")
-            sub["Explosive"] = explosive_mask(sub)
-            expl = sub["Explosive"].mean() if len(sub) else 0
+            expl = explosive_mask(sub).mean() if len(sub) else 0
             st.metric("Explosive Play Rate", f"{expl*100:.1f}%")
 
 # =========================
@@ -273,11 +501,11 @@ elif page == "Formation Explorer":
         st.info("No plays yet.")
     else:
         side = st.selectbox("Team Side", ["Offense","Defense"])
-        options = sorted(df.loc[df["TeamSide"]==side, "Formation"].dropna().astype(str).unique().tolist())
-        if not options:
+        formations = options["formations_by_side"].get(side, [])
+        if not formations:
             st.info(f"No Formation logged for {side}.")
         else:
-            formation = st.selectbox("Formation", options, index=0)
+            formation = st.selectbox("Formation", formations, index=0)
             formation_str = str(formation).replace(" ", "_").lower()
             img_path = os.path.join("hudl_drawings", f"formation_{formation_str}.png")
             if os.path.exists(img_path):
@@ -291,7 +519,7 @@ elif page == "Formation Explorer":
                 st.info("No plays for this grouping yet.")
             else:
                 sub["PlayType"] = sub["PlayType"].astype(str).str.strip().str.title()
-                runlike = sub["PlayType"].str.contains("Run|Rpo")
+                runlike = sub["_runlike"]
                 passlike = ~runlike
                 total = len(sub)
                 metrics = {
@@ -314,15 +542,8 @@ elif page == "Formation Explorer":
                 st.dataframe(pt, use_container_width=True)
                 st.bar_chart(pt.set_index("PlayType"))
 
-                by_down = sub.groupby("Down").agg(
-                    Plays=("Down","count"),
-                    SuccessRate=("Success","mean"),
-                    AvgYds=("ResultYards","mean")
-                ).reset_index()
-                if not by_down.empty:
-                    by_down["SuccessRate"] = (by_down["SuccessRate"]*100).round(1)
                 st.write("**By Down**")
-                st.dataframe(by_down, use_container_width=True)
+                st.dataframe(_by_down(sub), use_container_width=True)
 
 
 
@@ -333,12 +554,19 @@ elif page == "Admin":
     st.subheader("🛠 Admin")
     st.write(f"Backend: **{'Google Sheets' if USE_GOOGLE_SHEETS else 'CSV file'}**")
     if not df.empty:
-        st.download_button("Download CSV", df.to_csv(index=False).encode("utf-8"),
+        # encode straight into a byte buffer rather than building a str and then its bytes
+        buf = io.BytesIO()
+        df.to_csv(buf, columns=[c for c in df.columns if c not in DERIVED_COLUMNS], index=False, encoding="utf-8")
+        buf.seek(0)
+        st.download_button("Download CSV", buf,
                            file_name="plays_export.csv", mime="text/csv")
     col1, col2 = st.columns(2)
     with col1:
         if st.button("Reset (clear all plays)"):
-            storage.overwrite(pd.DataFrame(columns=storage.columns))
-            st.success("Cleared all data.")
+            dropped = storage.overwrite(pd.DataFrame(columns=storage.columns))
+            if dropped:
+                st.success(f"Cleared all data, including {dropped} unsynced queued play(s).")
+            else:
+                st.success("Cleared all data.")
     with col2:
         st.caption("Make sure `.gitignore` excludes `credentials.json` if you use Google Sheets.")
@@ -1,8 +1,10 @@
 # ---- PERSONNEL EXPLORER ------------------------------------------------------
+import io
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 st.header("🧩 Personnel Explorer")
 
@@ -21,23 +23,28 @@ personnel_options = sorted(df.loc[df["TeamSide"]==side, "Personnel"].dropna().as
 default_personnel = personnel_options[0] if personnel_options else "11"
 personnel = colB.selectbox("Personnel Grouping", options=personnel_options or ["11"], index=0)
 
-# --- helper: parse personnel string like "11", "12", "21", "10"
+# --- helper: parse personnel string like "11", "12", "21", "10" (None if it isn't one)
 def parse_personnel(tag: str):
     s = str(tag).strip()
     if len(s) == 1:  # allow "1" -> "10" style mistakes
         s = s + "0"
-    rb = int(s[0])
-    te = int(s[1])
+    try:
+        rb = int(s[0])
+        te = int(s[1])
+    except (IndexError, ValueError):
+        return None
     wr = 5 - (rb + te)  # QB + 5 OL are fixed; 5 skill = RB+TE+WR
     wr = max(0, wr)
     return rb, te, wr
 
-# --- helper: draw a simple diagram
-def draw_personnel_diagram(tag: str):
+# --- helper: draw a simple diagram (built off pyplot so reruns don't pile up figures)
+def _build_personnel_fig(tag: str) -> Figure:
     rb, te, wr = parse_personnel(tag)
 
     # field canvas
-    fig, ax = plt.subplots(figsize=(6, 3.6))
+    fig = Figure(figsize=(6, 3.6))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
     ax.set_xlim(0, 100)
     ax.set_ylim(0, 53.3)
     ax.axis("off")
@@ -46,14 +53,16 @@ def draw_personnel_diagram(tag: str):
     for y in [18.2, 35.1]:
         ax.plot([10, 90], [y, y], linewidth=1, alpha=0.2)
 
+    # player dots are collected here and drawn with a single scatter call at the end
+    dots = []
+
     # OL (five white dots across middle)
     ol_x = np.linspace(44, 56, 5)
-    for x in ol_x:
-        ax.scatter(x, 26.65, s=220, edgecolors="black", facecolors="white")
+    dots.extend((x, 26.65) for x in ol_x)
     ax.text(50, 26.65+6, "OL", ha="center", va="bottom")
 
     # QB
-    ax.scatter(50, 21, s=220, edgecolors="black", facecolors="white")
+    dots.append((50, 21))
     ax.text(50, 21-3, "QB", ha="center", va="top")
 
     # Place TEs (Y/H) tight to each side first
@@ -63,40 +72,52 @@ def draw_personnel_diagram(tag: str):
     if te >= 2:
         te_spots.append((42, 26.65))  # left TE (H)
     for i, (x, y) in enumerate(te_spots):
-        ax.scatter(x, y+4.5, s=220, edgecolors="black", facecolors="white")
+        dots.append((x, y+4.5))
         ax.text(x, y+4.5+2.5, "TE" if i == 0 else "TE/H", ha="center")
 
     # WRs: spread them wide (X/Z/slot)
     wr_locs = [(30, 26.65+6.5), (70, 26.65+6.5), (60, 26.65+14)]
     for i in range(min(wr, 3)):
         x, y = wr_locs[i]
-        ax.scatter(x, y, s=220, edgecolors="black", facecolors="white")
+        dots.append((x, y))
         ax.text(x, y+2.5, "WR", ha="center")
     # if >3 WR, drop extra into trips bunch area
     extra = wr - 3
     for i in range(max(0, extra)):
         x, y = 64 + i*3, 26.65+12 - i*2
-        ax.scatter(x, y, s=220, edgecolors="black", facecolors="white")
+        dots.append((x, y))
         ax.text(x, y+2.5, "WR", ha="center")
 
     # RBs: depth behind QB (HB/FB)
     rb_locs = [(50, 16), (46, 18)]
     for i in range(min(rb, 2)):
         x, y = rb_locs[i]
-        ax.scatter(x, y, s=220, edgecolors="black", facecolors="white")
+        dots.append((x, y))
         ax.text(x, y-2.5, "RB" if i == 0 else "FB", ha="center", va="top")
 
+    xs, ys = zip(*dots)
+    ax.scatter(xs, ys, s=220, edgecolors="black", facecolors="white")
+
     # title
     ax.text(50, 52, f"{tag} PERSONNEL  (WR {wr} / TE {te} / RB {rb})", ha="center", fontsize=12, fontweight="bold")
     return fig
 
+# --- helper: rendered diagram, cached per tag as PNG bytes so sessions never share a live Figure
+@st.cache_data(show_spinner=False)
+def _personnel_png(tag: str) -> bytes:
+    buf = io.BytesIO()
+    _build_personnel_fig(tag).savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    return buf.getvalue()
+
 # --- TENDENCY TABLES/CHARTS
 mask = (df["TeamSide"] == side) & (df["Personnel"].astype(str) == str(personnel))
 sub = df.loc[mask].copy()
 
 st.subheader("Diagram")
-fig = draw_personnel_diagram(personnel)
-st.pyplot(fig, use_container_width=True)
+if parse_personnel(personnel) is None:
+    st.warning(f"Can't draw personnel '{personnel}': expected two digits like 11, 12 or 21.")
+else:
+    st.image(_personnel_png(str(personnel)), use_container_width=True)
 
 st.subheader("Tendencies")
 if sub.empty: